@@ -1,5 +1,6 @@
 import os
 import json
+import math
 import re
 import requests
 from dotenv import load_dotenv
@@ -33,8 +34,14 @@ def extract_json_from_response(text):
 
     return None
 
-def search_youtube(query, max_results=3):
-    """Search YouTube and return actual video links"""
+YOUTUBE_CANDIDATES_PER_TOPIC = 10  # search.list costs the same quota for 1 or 50 results
+YOUTUBE_VIDEOS_PER_COURSE = 5
+YOUTUBE_MAX_SEARCH_RESULTS = 50  # search.list maxResults upper bound
+MIN_VIDEO_MINUTES = 2  # anything shorter is a Short, or a live/upcoming video (P0D)
+MAX_VIDEO_MINUTES = 60  # duration fit tapers to 0 here, so longer videos are ineligible
+
+def fetch_youtube_candidates(query, max_candidates=YOUTUBE_CANDIDATES_PER_TOPIC):
+    """Fetch a wide set of candidate videos for a query (one search + one details call)"""
     print(f"🎬 Starting YouTube search for: '{query}'")
     
     if not YOUTUBE_API_KEY:
@@ -48,8 +55,7 @@ def search_youtube(query, max_results=3):
         "q": query,
         "type": "video",
         "key": YOUTUBE_API_KEY,
-        "maxResults": max_results,
-        "videoDuration": "medium",  # Prefer medium length videos (4-20 minutes)
+        "maxResults": max_candidates,
         "videoEmbeddable": "true",
         "order": "relevance"
     }
@@ -66,11 +72,12 @@ def search_youtube(query, max_results=3):
             print("⚠️ No videos found in search results")
             return []
         
-        # Get video IDs for detailed info
+        # Get video IDs for detailed info, remembering the search (relevance) order
         video_ids = [video["id"]["videoId"] for video in videos]
+        search_rank = {video_id: rank for rank, video_id in enumerate(video_ids)}
         print(f"🎥 Video IDs: {video_ids}")
         
-        # Get detailed video information including duration
+        # Get detailed video information including duration and statistics
         details_url = "https://www.googleapis.com/youtube/v3/videos"
         details_params = {
             "part": "snippet,contentDetails,statistics",
@@ -84,39 +91,30 @@ def search_youtube(query, max_results=3):
         video_details = details_response.json().get("items", [])
         print(f"📊 Got details for {len(video_details)} videos")
         
-        results = []
+        candidates = []
         for video in video_details:
             video_id = video["id"]
             snippet = video["snippet"]
-            content_details = video["contentDetails"]
+            statistics = video.get("statistics", {})
             
             # Convert ISO 8601 duration to minutes
-            duration_str = content_details.get("duration", "PT0M")
-            duration_minutes = parse_duration(duration_str)
-            print(f"⏱️ Video duration: {duration_str} = {duration_minutes} minutes")
-            
-            # Filter out very short or very long videos
-            if duration_minutes < 2 or duration_minutes > 60:
-                print(f"⏭️ Skipping video (duration {duration_minutes} minutes): {snippet['title']}")
-                continue
-            
-            video_url = f"https://www.youtube.com/watch?v={video_id}"
+            duration_str = video["contentDetails"].get("duration", "PT0M")
             
-            result = {
+            candidates.append({
+                "video_id": video_id,
                 "title": snippet["title"],
-                "summary": snippet["description"][:200] + "..." if len(snippet["description"]) > 200 else snippet["description"],
-                "link": video_url,
-                "duration": f"{duration_minutes} minutes",
-                "topic": query,
-                "recommended_next_step": "Watch and practice along",
-                "type": "youtube"
-            }
-            
-            results.append(result)
-            print(f"✅ Added video: {snippet['title']}")
+                "description": snippet.get("description", ""),
+                "duration_minutes": parse_duration(duration_str),
+                # Like counts can be hidden by the uploader, so default to 0
+                "view_count": int(statistics.get("viewCount", 0)),
+                "like_count": int(statistics.get("likeCount", 0)),
+                "search_rank": search_rank.get(video_id, len(video_ids)),
+                "total_results": len(video_ids),
+                "topic": query
+            })
         
-        print(f"🎉 YouTube search completed. Found {len(results)} valid videos")
-        return results
+        print(f"🎉 YouTube search completed. Found {len(candidates)} candidate videos")
+        return candidates
         
     except requests.exceptions.HTTPError as e:
         print(f"❌ HTTP Error in YouTube API: {e}")
@@ -127,6 +125,77 @@ def search_youtube(query, max_results=3):
         print(f"❌ Error fetching YouTube videos: {e}")
         return []
 
+def score_duration(duration_minutes):
+    """Score how well a video length fits a learning session (1.0 = ideal, 0 = ineligible)"""
+    # Shorts and live/upcoming videos (reported as P0D, i.e. 0 minutes) are never a good lesson
+    if duration_minutes < MIN_VIDEO_MINUTES:
+        return 0.0
+    if duration_minutes < 4:
+        return 0.5 + 0.25 * (duration_minutes - 2)
+    if duration_minutes <= 20:
+        return 1.0
+    # Taper smoothly from 1.0 at 20 minutes down to 0 at MAX_VIDEO_MINUTES
+    return max(1.0 - (duration_minutes - 20) / (MAX_VIDEO_MINUTES - 20), 0.0)
+
+def score_youtube_quality(candidate):
+    """Score search relevance and view/like statistics, ignoring duration"""
+    relevance = 1.0 - candidate["search_rank"] / max(candidate["total_results"], 1)
+    views = candidate["view_count"]
+    popularity = min(math.log10(views + 1) / 7, 1.0)  # ~10M views saturates
+    like_ratio = min((candidate["like_count"] / views) / 0.04, 1.0) if views else 0.0
+    return 0.45 * relevance + 0.35 * popularity + 0.2 * like_ratio
+
+def rank_youtube_candidates(candidates, top_n=YOUTUBE_VIDEOS_PER_COURSE):
+    """Score all candidates, drop duplicates across topics and keep the top N overall"""
+    best_by_video = {}
+    for candidate in candidates:
+        # Shorts, live/upcoming videos and overly long videos are never returned
+        duration_fit = score_duration(candidate["duration_minutes"])
+        if duration_fit == 0:
+            continue
+        score = duration_fit * score_youtube_quality(candidate)
+        # Same video found under several topics: keep its best-scoring occurrence
+        current = best_by_video.get(candidate["video_id"])
+        if current is None or score > current[0]:
+            best_by_video[candidate["video_id"]] = (score, candidate)
+    
+    ranked = sorted(best_by_video.values(), key=lambda item: item[0], reverse=True)
+    
+    # Take the best video of each topic first so every topic is covered,
+    # then fill remaining slots with the next best videos overall
+    selected = []
+    covered_topics = set()
+    for score, candidate in ranked:
+        if candidate["topic"] not in covered_topics and len(selected) < top_n:
+            selected.append((score, candidate))
+            covered_topics.add(candidate["topic"])
+    for item in ranked:
+        if len(selected) >= top_n:
+            break
+        if item not in selected:
+            selected.append(item)
+    
+    selected.sort(key=lambda item: item[0], reverse=True)
+    return [format_youtube_resource(candidate) for score, candidate in selected]
+
+def format_youtube_resource(candidate):
+    """Convert a ranked candidate into a learning resource"""
+    description = candidate["description"]
+    return {
+        "title": candidate["title"],
+        "summary": description[:200] + "..." if len(description) > 200 else description,
+        "link": f"https://www.youtube.com/watch?v={candidate['video_id']}",
+        "duration": f"{candidate['duration_minutes']} minutes",
+        "topic": candidate["topic"],
+        "recommended_next_step": "Watch and practice along",
+        "type": "youtube"
+    }
+
+def search_youtube(query, max_results=3):
+    """Search YouTube and return the best ranked video links"""
+    candidates = fetch_youtube_candidates(query, max_candidates=min(max(max_results, YOUTUBE_CANDIDATES_PER_TOPIC), YOUTUBE_MAX_SEARCH_RESULTS))
+    return rank_youtube_candidates(candidates, top_n=max_results)
+
 def parse_duration(duration_str):
     """Convert ISO 8601 duration to minutes"""
     import re
@@ -328,12 +397,13 @@ Format the output as a **JSON object** like this:
             # Now add YouTube videos using the YouTube API
             print("🎬 Adding YouTube videos...")
             youtube_topics = generate_youtube_topics(user_skills, user_goal)
-            youtube_resources = []
+            youtube_candidates = []
             
-            # Search for videos for each topic (limit to 1 video per topic to get 5 total)
+            # Fetch a wide candidate set per topic (still one search per topic),
+            # then rank them all together to keep the best 5 videos overall
             for topic in youtube_topics:
-                videos = search_youtube(topic, max_results=1)
-                youtube_resources.extend(videos)
+                youtube_candidates.extend(fetch_youtube_candidates(topic))
+            youtube_resources = rank_youtube_candidates(youtube_candidates, top_n=YOUTUBE_VIDEOS_PER_COURSE)
             
             # Add YouTube resources to the recommendations
             if 'resources' not in recommendations:
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Offline checks for YouTube candidate ranking (no API calls)
+"""
+
+from groq import parse_duration, rank_youtube_candidates
+
+def make_candidate(video_id, topic, duration_minutes=10, view_count=10000, like_count=400, search_rank=0):
+    return {
+        "video_id": video_id,
+        "title": f"Video {video_id}",
+        "description": "",
+        "duration_minutes": duration_minutes,
+        "view_count": view_count,
+        "like_count": like_count,
+        "search_rank": search_rank,
+        "total_results": 10,
+        "topic": topic
+    }
+
+def video_ids(resources):
+    return [resource["link"].split("v=")[1] for resource in resources]
+
+def test_duplicate_across_topics_returned_once():
+    candidates = [
+        make_candidate("dup", "topic 1"),
+        make_candidate("dup", "topic 2", search_rank=3),
+        make_candidate("other", "topic 2", search_rank=5)
+    ]
+    ids = video_ids(rank_youtube_candidates(candidates, top_n=5))
+    assert ids.count("dup") == 1
+    assert sorted(ids) == ["dup", "other"]
+
+def test_every_topic_covered():
+    candidates = []
+    # Topic 1 has the strongest videos, but each topic should still get a slot
+    for rank in range(5):
+        candidates.append(make_candidate(f"strong{rank}", "topic 1", view_count=5000000, search_rank=rank))
+    for topic in ["topic 2", "topic 3", "topic 4", "topic 5"]:
+        candidates.append(make_candidate(f"{topic}-weak", topic, view_count=100, search_rank=9))
+    resources = rank_youtube_candidates(candidates, top_n=5)
+    assert len(resources) == 5
+    assert {resource["topic"] for resource in resources} == {"topic 1", "topic 2", "topic 3", "topic 4", "topic 5"}
+
+def test_unusable_lengths_not_selected_over_in_range():
+    candidates = [
+        make_candidate("live", "topic 1", duration_minutes=parse_duration("P0D"), view_count=5000000),
+        make_candidate("short", "topic 2", duration_minutes=0.5, view_count=1000000),
+        make_candidate("stream", "topic 3", duration_minutes=300, view_count=5000000),
+        make_candidate("long", "topic 5", duration_minutes=61, view_count=5000000),
+        make_candidate("good1", "topic 1", view_count=2000, search_rank=5),
+        make_candidate("good2", "topic 4", view_count=100, search_rank=9)
+    ]
+    assert video_ids(rank_youtube_candidates(candidates, top_n=2)) == ["good1", "good2"]
+    # Unusable lengths are never returned, even when that leaves slots empty
+    assert video_ids(rank_youtube_candidates(candidates, top_n=5)) == ["good1", "good2"]
+
+def test_empty_input():
+    assert rank_youtube_candidates([]) == []
+
+def main():
+    tests = [
+        test_duplicate_across_topics_returned_once,
+        test_every_topic_covered,
+        test_unusable_lengths_not_selected_over_in_range,
+        test_empty_input
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\n{len(tests) - failed}/{len(tests)} ranking checks passed")
+
+if __name__ == "__main__":
+    main()